@@ -20,6 +20,19 @@ BRICK_HEIGHT = 30
 BRICK_GAP = 5
 PADDLE_SPEED = 10
 BALL_SPEED = 5
+JOYSTICK_DEADZONE = 0.15
+LATENCY_SAMPLES = 30  # Number of frames averaged for the latency readout
+FPS = 60
+FRAME_MS = 1000 / FPS
+ARENA_SCREENS = 5  # World height in screens when arena mode is on
+CAMERA_FOLLOW = 0.15  # Fraction of the distance the camera closes each frame
+BRICK_TOP = 50  # Y position of the first brick row
+BRICK_ROW_PITCH = BRICK_HEIGHT + BRICK_GAP
+
+# Paddle control modes
+CONTROL_KEYBOARD = 0
+CONTROL_MOUSE = 1
+CONTROL_ANALOG = 2
 
 # Colors
 WHITE = (255, 255, 255)
@@ -100,14 +113,15 @@ class PowerUp:
         else:  # POWERUP_SLOW_BALL
             self.color = GREEN
     
-    def update(self):
+    def update(self, world_height=SCREEN_HEIGHT):
         self.y += self.speed
-        # Deactivate if it goes off screen
-        if self.y > SCREEN_HEIGHT:
+        # Deactivate if it goes off the bottom of the world
+        if self.y > world_height:
             self.active = False
     
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    def draw(self, screen, offset_y=0):
+        y = self.y - offset_y
+        pygame.draw.rect(screen, self.color, (self.x, y, self.width, self.height))
         
         # Draw an icon or letter to indicate power-up type
         font = pygame.font.SysFont(None, 24)
@@ -118,7 +132,7 @@ class PowerUp:
         else:  # POWERUP_SLOW_BALL
             text = font.render("S", True, WHITE)
             
-        text_rect = text.get_rect(center=(self.x + self.width//2, self.y + self.height//2))
+        text_rect = text.get_rect(center=(self.x + self.width//2, y + self.height//2))
         screen.blit(text, text_rect)
     
     def collides_with_paddle(self, paddle_x, paddle_y, paddle_width, paddle_height):
@@ -137,7 +151,7 @@ class Ball:
         self.radius = BALL_RADIUS
         self.active = True
     
-    def update(self):
+    def update(self, world_height=SCREEN_HEIGHT):
         self.x += self.dx
         self.y += self.dy
         
@@ -147,16 +161,17 @@ class Ball:
         if self.y <= self.radius:
             self.dy *= -1
         
-        # Check if ball goes below screen
-        if self.y >= SCREEN_HEIGHT:
+        # Check if ball goes below the bottom of the world
+        if self.y >= world_height:
             self.active = False
     
-    def draw(self, screen):
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius)
+    def draw(self, screen, offset_y=0):
+        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y - offset_y)), self.radius)
 
 class Brick:
-    def __init__(self, x, y, width, height, color, health=1):
+    def __init__(self, x, y, width, height, color, health=1, row=0):
         self.rect = pygame.Rect(x, y, width, height)
+        self.row = row
         self.color = color
         self.health = health
         self.max_health = health
@@ -205,7 +220,15 @@ class Brick:
             if particle['lifetime'] <= 0:
                 self.particles.remove(particle)
     
-    def draw(self, screen):
+    def skip_animation(self):
+        # Finish any pending animation at once, used for bricks outside the viewport
+        self.just_hit = False
+        self.hit_animation_current = 0
+        if self.hit and self.health <= 0:
+            self.current_frame = self.animation_frames
+            self.particles = []
+    
+    def draw(self, screen, offset_y=0):
         if self.hit and self.health <= 0:
             # Create particles on first frame of destruction
             if self.current_frame == 0:
@@ -218,7 +241,7 @@ class Brick:
             for particle in self.particles:
                 s = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
                 s.fill((self.color[0], self.color[1], self.color[2], particle['alpha']))
-                screen.blit(s, (particle['x'], particle['y']))
+                screen.blit(s, (particle['x'], particle['y'] - offset_y))
             
             # Animation when brick is destroyed
             self.current_frame += 1
@@ -232,7 +255,7 @@ class Brick:
                 new_width = self.original_width * scale_factor
                 new_height = self.original_height * scale_factor
                 new_x = self.rect.x + (self.original_width - new_width) / 2
-                new_y = self.rect.y + (self.original_height - new_height) / 2
+                new_y = self.rect.y - offset_y + (self.original_height - new_height) / 2
                 
                 # Create a surface with per-pixel alpha
                 s = pygame.Surface((new_width, new_height), pygame.SRCALPHA)
@@ -258,7 +281,7 @@ class Brick:
                 # Draw the brick with flash and shake
                 pygame.draw.rect(screen, (r, g, b), 
                                 (self.rect.x + shake_offset_x, 
-                                 self.rect.y + shake_offset_y, 
+                                 self.rect.y - offset_y + shake_offset_y, 
                                  self.rect.width, self.rect.height))
                 
                 # Reset hit animation when complete
@@ -271,24 +294,140 @@ class Brick:
                 r = min(255, int(self.color[0] * color_factor + 100))
                 g = min(255, int(self.color[1] * color_factor + 100))
                 b = min(255, int(self.color[2] * color_factor + 100))
-                pygame.draw.rect(screen, (r, g, b), self.rect)
+                pygame.draw.rect(screen, (r, g, b), self.rect.move(0, -offset_y))
             
             # Draw health indicator if health > 1
             if self.max_health > 1:
                 font = pygame.font.SysFont(None, 24)
                 text = font.render(str(self.health), True, WHITE)
                 text_rect = text.get_rect(center=(self.rect.x + self.rect.width//2, 
-                                                 self.rect.y + self.rect.height//2))
+                                                 self.rect.y - offset_y + self.rect.height//2))
                 screen.blit(text, text_rect)
             
             return False
 
+class PaddleInput:
+    def __init__(self):
+        self.mode = CONTROL_KEYBOARD
+        self.mouse_x = None
+        self.axis_value = 0.0
+        self.joystick = None
+        self.init_joystick()
+
+        # Events drained by poll() and waiting for the game's handle_events
+        self.queued_events = []
+
+        # Latency tracking: arrival time of the oldest input not yet shown on screen
+        self.pending_input_time = None
+        self.latency_samples = []
+        self.latency_ms = 0
+
+    def init_joystick(self, device_index=None, exclude_instance_id=None):
+        # Open the given device, or else the first connected pad that isn't excluded
+        try:
+            pygame.joystick.init()
+            if device_index is not None:
+                indices = [device_index]
+            else:
+                indices = range(pygame.joystick.get_count())
+            for index in indices:
+                joystick = pygame.joystick.Joystick(index)
+                if joystick.get_instance_id() != exclude_instance_id:
+                    joystick.init()
+                    self.joystick = joystick
+                    return
+        except pygame.error as e:
+            self.joystick = None
+            print(f"Could not initialize joystick: {e}")
+
+    def mark_input(self, arrival_time):
+        if self.pending_input_time is None:
+            self.pending_input_time = arrival_time
+
+    def process_event(self, event, arrival_time):
+        if event.type == pygame.MOUSEMOTION:
+            self.mode = CONTROL_MOUSE
+            self.mouse_x = event.pos[0]
+            self.mark_input(arrival_time)
+        elif (event.type == pygame.JOYAXISMOTION and event.axis == 0 and self.joystick is not None
+              and event.instance_id == self.joystick.get_instance_id()):
+            value = event.value if abs(event.value) > JOYSTICK_DEADZONE else 0.0
+            if value != self.axis_value:
+                self.mode = CONTROL_ANALOG
+                self.axis_value = value
+                self.mark_input(arrival_time)
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            self.mode = CONTROL_KEYBOARD
+            self.mark_input(arrival_time)
+        elif event.type == pygame.JOYDEVICEADDED and self.joystick is None:
+            self.init_joystick(event.device_index)
+        elif (event.type == pygame.JOYDEVICEREMOVED and self.joystick is not None
+              and event.instance_id == self.joystick.get_instance_id()):
+            self.joystick = None
+            if self.mode == CONTROL_ANALOG:
+                self.axis_value = 0.0
+                self.mode = CONTROL_KEYBOARD
+            # Fall back to any pad that is still connected
+            self.init_joystick(exclude_instance_id=event.instance_id)
+
+    def poll(self):
+        # Called many times per frame, so the poll time is close to the event's arrival time
+        arrival_time = pygame.time.get_ticks()
+        for event in pygame.event.get():
+            self.process_event(event, arrival_time)
+            self.queued_events.append(event)
+
+    def get_events(self):
+        self.poll()
+        events = self.queued_events
+        self.queued_events = []
+        return events
+
+    def wait_for_frame(self, deadline):
+        # Poll input until the frame deadline instead of sleeping through it
+        while pygame.time.get_ticks() < deadline:
+            self.poll()
+            pygame.time.wait(1)
+
+    def paddle_position(self, paddle_x, paddle_width):
+        self.poll()
+        max_x = SCREEN_WIDTH - paddle_width
+
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]:
+            self.mode = CONTROL_KEYBOARD
+            if keys[pygame.K_LEFT] and paddle_x > 0:
+                paddle_x -= PADDLE_SPEED
+            if keys[pygame.K_RIGHT] and paddle_x < max_x:
+                paddle_x += PADDLE_SPEED
+
+        if self.mode == CONTROL_MOUSE and self.mouse_x is not None:
+            paddle_x = self.mouse_x - paddle_width // 2
+        elif self.mode == CONTROL_ANALOG:
+            # Map the axis (-1 to 1) directly onto the paddle's travel range
+            paddle_x = (self.axis_value + 1) / 2 * max_x
+
+        return max(0, min(paddle_x, max_x))
+
+    def frame_presented(self, record=True):
+        # Call right after the display flip to record input-to-flip latency
+        if self.pending_input_time is None:
+            return
+        pending_time = self.pending_input_time
+        self.pending_input_time = None
+        if not record:
+            # The paddle isn't responding (paused or between rounds), so drop the sample
+            return
+        self.latency_samples.append(pygame.time.get_ticks() - pending_time)
+        if len(self.latency_samples) > LATENCY_SAMPLES:
+            self.latency_samples.pop(0)
+        self.latency_ms = sum(self.latency_samples) / len(self.latency_samples)
+
 # Game class
 class BrickBreaker:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Brick Breaker")
-        self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont(None, 36)
         self.small_font = pygame.font.SysFont(None, 24)
         
@@ -315,8 +454,12 @@ class BrickBreaker:
         # Load high score
         self.high_score = self.load_high_score()
         
+        # Input layer for keyboard, mouse and analog paddle control
+        self.input = PaddleInput()
+        
         self.level = 0
         self.paused = False
+        self.arena_mode = False
         self.reset_game()
         
     def load_high_score(self):
@@ -337,9 +480,13 @@ class BrickBreaker:
             print(f"Error saving high score: {e}")
         
     def reset_game(self):
+        # World and camera setup (the world is one screen tall outside arena mode)
+        self.world_height = SCREEN_HEIGHT * ARENA_SCREENS if self.arena_mode else SCREEN_HEIGHT
+        self.camera_y = self.world_height - SCREEN_HEIGHT
+        
         # Paddle setup
         self.paddle_x = SCREEN_WIDTH // 2 - PADDLE_WIDTH // 2
-        self.paddle_y = SCREEN_HEIGHT - 50
+        self.paddle_y = self.world_height - 50
         self.paddle_width = PADDLE_WIDTH
         
         # Set up balls
@@ -348,7 +495,7 @@ class BrickBreaker:
         
         self.balls = [Ball(
             SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT - 70,
+            self.world_height - 70,
             random.choice([-1, 1]) * self.ball_speed,
             -self.ball_speed,
             self.ball_speed
@@ -362,23 +509,37 @@ class BrickBreaker:
         }
         
         # Bricks setup
-        self.bricks = []
+        self.brick_rows = {}  # Row index -> bricks in that row, used for culling
+        self.brick_count = 0  # Bricks still in the world, including ones mid-animation
+        self.finished_bricks = set()
+        self.animating_bricks = set()  # Bricks with a hit or destruction animation in progress
         rows = current_level["rows"]
         cols = current_level["cols"]
         brick_health_max = current_level["brick_health_max"]
         
-        for row in range(rows):
-            for col in range(cols):
-                brick_x = col * (BRICK_WIDTH + BRICK_GAP) + BRICK_GAP + (SCREEN_WIDTH - cols * (BRICK_WIDTH + BRICK_GAP)) // 2
-                brick_y = row * (BRICK_HEIGHT + BRICK_GAP) + BRICK_GAP + 50
-                
-                # Randomly assign health to bricks based on level
-                health = random.randint(1, brick_health_max)
-                
-                self.bricks.append(Brick(
-                    brick_x, brick_y, BRICK_WIDTH, BRICK_HEIGHT, 
-                    COLORS[row % len(COLORS)], health
-                ))
+        # Arena mode repeats the level's rows once per screen, leaving the bottom screen clear
+        bands = ARENA_SCREENS - 1 if self.arena_mode else 1
+        rows_per_screen = SCREEN_HEIGHT // BRICK_ROW_PITCH
+        
+        for band in range(bands):
+            for row in range(rows):
+                grid_row = band * rows_per_screen + row
+                for col in range(cols):
+                    brick_x = col * (BRICK_WIDTH + BRICK_GAP) + BRICK_GAP + (SCREEN_WIDTH - cols * (BRICK_WIDTH + BRICK_GAP)) // 2
+                    brick_y = grid_row * BRICK_ROW_PITCH + BRICK_GAP + BRICK_TOP
+                    
+                    # Randomly assign health to bricks based on level
+                    health = random.randint(1, brick_health_max)
+                    
+                    brick = Brick(
+                        brick_x, brick_y, BRICK_WIDTH, BRICK_HEIGHT, 
+                        COLORS[row % len(COLORS)], health, grid_row
+                    )
+                    self.brick_rows.setdefault(grid_row, []).append(brick)
+                    self.brick_count += 1
+        
+        self.bricks_remaining = self.brick_count
+        self.bricks_drawn = 0
         
         # Game state
         self.score = 0 if self.level == 0 else self.score
@@ -386,6 +547,39 @@ class BrickBreaker:
         self.game_won = False
         self.level_complete = False
     
+    def bricks_in_range(self, top, bottom):
+        # Use the brick grid to find the rows overlapping [top, bottom] without scanning every brick
+        first_row = max(0, int(top - BRICK_TOP - BRICK_GAP - BRICK_HEIGHT) // BRICK_ROW_PITCH)
+        last_row = int(bottom - BRICK_TOP - BRICK_GAP) // BRICK_ROW_PITCH
+        for row in range(first_row, last_row + 1):
+            for brick in self.brick_rows.get(row, ()):
+                yield brick
+    
+    def is_visible(self, y, height):
+        return y + height >= self.camera_y and y <= self.camera_y + SCREEN_HEIGHT
+    
+    def remove_brick(self, brick):
+        self.brick_count -= 1
+        self.animating_bricks.discard(brick)
+        row = self.brick_rows[brick.row]
+        row.remove(brick)
+        if not row:
+            del self.brick_rows[brick.row]
+    
+    def update_camera(self):
+        if self.world_height <= SCREEN_HEIGHT:
+            self.camera_y = 0
+            return
+        
+        # Follow the lowest ball, keeping it in the lower part of the screen
+        if self.balls:
+            lead_y = max(ball.y for ball in self.balls)
+            target = lead_y - SCREEN_HEIGHT * 2 // 3
+        else:
+            target = self.paddle_y
+        target = max(0, min(target, self.world_height - SCREEN_HEIGHT))
+        self.camera_y += (target - self.camera_y) * CAMERA_FOLLOW
+    
     def next_level(self):
         self.level += 1
         if self.level < len(LEVELS):
@@ -398,7 +592,7 @@ class BrickBreaker:
                 self.save_high_score()
     
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.input.get_events():
             if event.type == pygame.QUIT:
                 # Save high score before quitting
                 if self.score > self.high_score:
@@ -415,16 +609,25 @@ class BrickBreaker:
                     self.next_level()
                 elif event.key == pygame.K_p:
                     self.paused = not self.paused
+                elif event.key == pygame.K_a and (self.paused or self.game_over or self.game_won):
+                    # Check for high score before the restart discards it
+                    if self.score > self.high_score:
+                        self.high_score = self.score
+                        self.save_high_score()
+                    self.arena_mode = not self.arena_mode
+                    self.level = 0
+                    self.score = 0
+                    self.paused = False
+                    self.reset_game()
         
-        if self.paused:
-            return
-            
-        # Paddle movement
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.paddle_x > 0:
-            self.paddle_x -= PADDLE_SPEED
-        if keys[pygame.K_RIGHT] and self.paddle_x < SCREEN_WIDTH - self.paddle_width:
-            self.paddle_x += PADDLE_SPEED
+        # Paddle movement is sampled later, right before the paddle collision check
+    
+    def paddle_active(self):
+        return not (self.game_over or self.game_won or self.level_complete or self.paused)
+    
+    def update_paddle(self):
+        # The drawn paddle uses this same position, so it is always where physics tested it
+        self.paddle_x = self.input.paddle_position(self.paddle_x, self.paddle_width)
     
     def update(self):
         if self.game_over or self.game_won or self.level_complete or self.paused:
@@ -448,9 +651,12 @@ class BrickBreaker:
                                 ball.dx = ball.dx / magnitude * ball.speed
                                 ball.dy = ball.dy / magnitude * ball.speed
         
+        # Sample input as late as possible, right before the paddle collision check
+        self.update_paddle()
+        
         # Update balls
         for ball in self.balls[:]:
-            ball.update()
+            ball.update(self.world_height)
             
             # Ball collision with paddle - improved to handle corner collisions
             paddle_rect = pygame.Rect(self.paddle_x, self.paddle_y, self.paddle_width, PADDLE_HEIGHT)
@@ -480,8 +686,8 @@ class BrickBreaker:
                     ball.dx = angle * ball.speed
                     ball.dy = -abs(ball.dy)  # Always bounce up
             
-            # Ball collision with bricks
-            for brick in self.bricks[:]:
+            # Ball collision with bricks in the rows the ball overlaps
+            for brick in self.bricks_in_range(ball.y - ball.radius, ball.y + ball.radius):
                 if brick.hit and brick.health <= 0:
                     continue
                     
@@ -501,6 +707,7 @@ class BrickBreaker:
                     
                     if brick.health <= 0:
                         brick.hit = True
+                        self.bricks_remaining -= 1
                         self.score += 10
                         
                         # Chance to spawn a power-up (20%)
@@ -514,6 +721,14 @@ class BrickBreaker:
                     else:
                         self.score += 1
                     
+                    # Animations only run for bricks on screen
+                    if self.is_visible(brick.rect.y, brick.rect.height):
+                        self.animating_bricks.add(brick)
+                    else:
+                        brick.skip_animation()
+                        if brick.hit and brick.health <= 0:
+                            self.finished_bricks.add(brick)
+                    
                     if self.bounce_sound:
                         self.bounce_sound.play()
                     
@@ -529,7 +744,7 @@ class BrickBreaker:
         
         # Update power-ups
         for power_up in self.power_ups[:]:
-            power_up.update()
+            power_up.update(self.world_height)
             
             # Check collision with paddle
             if power_up.collides_with_paddle(self.paddle_x, self.paddle_y, self.paddle_width, PADDLE_HEIGHT):
@@ -571,8 +786,23 @@ class BrickBreaker:
             elif not power_up.active:
                 self.power_ups.remove(power_up)
         
+        # Finish animations of bricks that have scrolled out of the viewport
+        for brick in list(self.animating_bricks):
+            destroyed = brick.hit and brick.health <= 0
+            if not (brick.just_hit or destroyed):
+                self.animating_bricks.discard(brick)
+            elif not self.is_visible(brick.rect.y, brick.rect.height):
+                brick.skip_animation()
+                self.animating_bricks.discard(brick)
+                if destroyed:
+                    self.finished_bricks.add(brick)
+        
         # Remove bricks that have completed their animation
-        self.bricks = [brick for brick in self.bricks if not (brick.hit and brick.health <= 0 and brick.current_frame >= brick.animation_frames and not brick.particles)]
+        for brick in self.finished_bricks:
+            self.remove_brick(brick)
+        self.finished_bricks.clear()
+        
+        self.update_camera()
         
         # Check if game is over (no balls left)
         if not self.balls:
@@ -583,7 +813,7 @@ class BrickBreaker:
                 self.save_high_score()
         
         # Check if all bricks are broken or being animated
-        if not any(not brick.hit or brick.health > 0 for brick in self.bricks):
+        if self.bricks_remaining <= 0:
             if self.level < len(LEVELS) - 1:
                 self.level_complete = True
             else:
@@ -600,20 +830,32 @@ class BrickBreaker:
         else:
             self.screen.fill(BLACK)
         
+        # Everything in the world is drawn relative to the camera and culled to the viewport
+        camera_y = int(self.camera_y)
+        
         # Draw paddle
-        pygame.draw.rect(self.screen, WHITE, (self.paddle_x, self.paddle_y, self.paddle_width, PADDLE_HEIGHT))
+        if self.is_visible(self.paddle_y, PADDLE_HEIGHT):
+            pygame.draw.rect(self.screen, WHITE, (self.paddle_x, self.paddle_y - camera_y, self.paddle_width, PADDLE_HEIGHT))
+        else:
+            # Paddle is below the viewport, so outline it at the bottom edge to keep it lined up
+            pygame.draw.rect(self.screen, WHITE, (self.paddle_x, SCREEN_HEIGHT - PADDLE_HEIGHT, self.paddle_width, PADDLE_HEIGHT), 2)
         
         # Draw balls
         for ball in self.balls:
-            ball.draw(self.screen)
+            if self.is_visible(ball.y - ball.radius, ball.radius * 2):
+                ball.draw(self.screen, camera_y)
         
         # Draw power-ups
         for power_up in self.power_ups:
-            power_up.draw(self.screen)
+            if self.is_visible(power_up.y, power_up.height):
+                power_up.draw(self.screen, camera_y)
         
-        # Draw bricks
-        for brick in self.bricks:
-            brick.draw(self.screen)
+        # Draw bricks (this also advances their animations)
+        self.bricks_drawn = 0
+        for brick in self.bricks_in_range(camera_y, camera_y + SCREEN_HEIGHT):
+            self.bricks_drawn += 1
+            if brick.draw(self.screen, camera_y):
+                self.finished_bricks.add(brick)
         
         # Draw score and level
         score_text = self.font.render(f"Score: {self.score}", True, WHITE)
@@ -640,6 +882,16 @@ class BrickBreaker:
                 self.screen.blit(power_up_text, (10, y_offset))
                 y_offset += 25
         
+        # Draw stats under the level, right-aligned
+        stats = [(f"Input-to-flip: {self.input.latency_ms:.0f} ms", WHITE)]
+        if self.arena_mode:
+            stats.insert(0, ("Arena", YELLOW))
+            stats.append((f"Bricks drawn: {self.bricks_drawn}/{self.brick_count}", WHITE))
+        
+        for i, (stat, color) in enumerate(stats):
+            stat_text = self.small_font.render(stat, True, color)
+            self.screen.blit(stat_text, stat_text.get_rect(topright=(SCREEN_WIDTH - 10, 40 + i * 25)))
+        
         # Draw game over or win message
         if self.game_over:
             game_over_text = self.font.render("Game Over! Press R to restart", True, RED)
@@ -674,7 +926,8 @@ class BrickBreaker:
             instructions = [
                 "Press P to resume",
                 "Press R to restart",
-                "Arrow keys to move paddle"
+                "Press A to toggle arena mode",
+                "Arrow keys, mouse or gamepad to move paddle"
             ]
             
             for i, instruction in enumerate(instructions):
@@ -682,10 +935,14 @@ class BrickBreaker:
                 self.screen.blit(text, (SCREEN_WIDTH // 2 - 80, SCREEN_HEIGHT // 2 + i * 30))
         
         pygame.display.flip()
+        self.input.frame_presented(record=self.paddle_active())
     
     def run(self):
+        frame_deadline = pygame.time.get_ticks()
         while True:
-            self.clock.tick(60)
+            self.input.wait_for_frame(frame_deadline)
+            # Don't try to catch up on frames missed after a stall
+            frame_deadline = max(frame_deadline + FRAME_MS, pygame.time.get_ticks())
             self.handle_events()
             self.update()
             self.draw()